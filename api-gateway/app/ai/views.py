@@ -5,7 +5,7 @@ from django.conf import settings
 import requests
 import json
 import logging
-from sentence_transformers import SentenceTransformer, CrossEncoder
+from app.ml_models import model, cross_encoder, inference_lock
 from qdrant_client import QdrantClient
 from qdrant_client.http import models
 
@@ -20,11 +20,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger('ai_views')
 
-# TODO should not hard code this.
-model = SentenceTransformer('all-MiniLM-L6-v2')
-
-cross_encoder = CrossEncoder(settings.CROSS_ENCODER_MODEL)
-
 qdrant_client = QdrantClient(host=settings.QDRANT_HOST, port=settings.QDRANT_PORT)
 
 class SuggestionsView(APIView):
@@ -52,7 +47,8 @@ class SuggestionsView(APIView):
                     "model": settings.OLLAMA_MODEL,
                     "prompt": prompt,
                     "stream": False
-                }
+                },
+                timeout=settings.OLLAMA_TIMEOUT
             )
             
             if response.status_code != 200:
@@ -106,7 +102,8 @@ class AskView(APIView):
             return Response({"error": "Question is required"}, status=status.HTTP_400_BAD_REQUEST)
         
         try:
-            question_embedding = model.encode(question)
+            with inference_lock:
+                question_embedding = model.encode(question)
             
             # retrieve 20 candidates for re-ranking
             search_results = qdrant_client.search(
@@ -118,7 +115,8 @@ class AskView(APIView):
             
             if search_results:
                 pairs = [[question, result.payload.get('content', '')] for result in search_results]
-                scores = cross_encoder.predict(pairs)
+                with inference_lock:
+                    scores = cross_encoder.predict(pairs)
                 scored_results = list(zip(search_results, scores))
                 scored_results.sort(key=lambda x: x[1], reverse=True)
                 search_results = [item[0] for item in scored_results[:5]]
@@ -151,7 +149,8 @@ class AskView(APIView):
                     "model": settings.OLLAMA_MODEL,
                     "prompt": prompt,
                     "stream": False
-                }
+                },
+                timeout=settings.OLLAMA_TIMEOUT
             )
             
             if response.status_code != 200:
@@ -180,7 +179,8 @@ class SearchView(APIView):
             return Response({"error": "Query is required"}, status=status.HTTP_400_BAD_REQUEST)
         
         try:
-            query_embedding = model.encode(query)
+            with inference_lock:
+                query_embedding = model.encode(query)
             
             search_results = qdrant_client.search(
                 collection_name=settings.QDRANT_COLLECTION,
@@ -196,7 +196,8 @@ class SearchView(APIView):
                 
                 # get relevance scores
                 logger.info(f"Using cross-encoder model: {settings.CROSS_ENCODER_MODEL} for re-ranking")
-                scores = cross_encoder.predict(pairs)
+                with inference_lock:
+                    scores = cross_encoder.predict(pairs)
                 
                 scored_results = list(zip(search_results, scores))
                 scored_results.sort(key=lambda x: x[1], reverse=True)
@@ -0,0 +1,16 @@
+import threading
+
+from django.conf import settings
+from sentence_transformers import SentenceTransformer, CrossEncoder
+
+# Loaded once per process. wsgi.py imports this module so that a preloading
+# server (see gunicorn.conf.py) loads the weights in the master and every
+# forked worker shares them copy-on-write instead of loading its own copy.
+model = SentenceTransformer(settings.EMBEDDING_MODEL)
+
+cross_encoder = CrossEncoder(settings.CROSS_ENCODER_MODEL)
+
+# gunicorn runs several request threads per worker. The HuggingFace fast
+# tokenizers behind both models are not safe to call concurrently, so inference
+# is serialised per worker; torch's intra-op threads still parallelise each call.
+inference_lock = threading.Lock()
@@ -4,13 +4,13 @@ from rest_framework.response import Response
 from django.conf import settings
 from .models import Note
 from .serializers import NoteSerializer
-from sentence_transformers import SentenceTransformer
+from app.ml_models import model, inference_lock
 from qdrant_client import QdrantClient
 from qdrant_client.http import models
+from qdrant_client.http.exceptions import UnexpectedResponse
 import uuid
 
-model = SentenceTransformer('all-MiniLM-L6-v2')
-EMBEDDING_SIZE = 384 
+EMBEDDING_SIZE = model.get_sentence_embedding_dimension()
 
 # create Qdrant client
 qdrant_client = QdrantClient(host=settings.QDRANT_HOST, port=settings.QDRANT_PORT)
@@ -21,13 +21,19 @@ def ensure_collection_exists():
     collection_exists = any(collection.name == settings.QDRANT_COLLECTION for collection in collections)
 
     if not collection_exists:
-        qdrant_client.create_collection(
-            collection_name=settings.QDRANT_COLLECTION,
-            vectors_config=models.VectorParams(
-                size=EMBEDDING_SIZE,
-                distance=models.Distance.COSINE
+        try:
+            qdrant_client.create_collection(
+                collection_name=settings.QDRANT_COLLECTION,
+                vectors_config=models.VectorParams(
+                    size=EMBEDDING_SIZE,
+                    distance=models.Distance.COSINE
+                )
             )
-        )
+        except UnexpectedResponse:
+            # another gunicorn worker may have created it since we checked
+            collections = qdrant_client.get_collections().collections
+            if not any(collection.name == settings.QDRANT_COLLECTION for collection in collections):
+                raise
 
 # Call this function when the app starts
 ensure_collection_exists()
@@ -40,7 +46,8 @@ class NoteViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         note = serializer.save()
-        embedding = model.encode(note.content)
+        with inference_lock:
+            embedding = model.encode(note.content)
         vector_id = uuid.uuid4()
 
         qdrant_client.upsert(
@@ -73,7 +80,8 @@ class NoteViewSet(viewsets.ModelViewSet):
         
         note = serializer.save()
         
-        embedding = model.encode(note.content)
+        with inference_lock:
+            embedding = model.encode(note.content)
         if note.vector_id:
             vector_id = note.vector_id
         else:
@@ -120,7 +128,8 @@ class NoteViewSet(viewsets.ModelViewSet):
             return Response({"error": "Query parameter 'q' is required"}, status=status.HTTP_400_BAD_REQUEST)
         
         #  embeds for the search query
-        query_embedding = model.encode(query)
+        with inference_lock:
+            query_embedding = model.encode(query)
         
         # measures similar notes in Qdrant
         search_results = qdrant_client.search(
@@ -64,8 +64,16 @@ WSGI_APPLICATION = 'app.wsgi.application'
 # Database
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
+        # Django's sqlite3 backend with WAL mode enabled per connection (app/db/base.py)
+        'ENGINE': 'app.db',
         'NAME': os.path.join(BASE_DIR, 'data', 'db.sqlite3'),
+        # Seconds to wait on a locked database before raising "database is locked".
+        'OPTIONS': {
+            'timeout': float(os.environ.get('SQLITE_TIMEOUT', 20)),
+        },
+        # Keep connections open across requests instead of reconnecting each time.
+        'CONN_MAX_AGE': int(os.environ.get('CONN_MAX_AGE', 600)),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -121,6 +129,11 @@ QDRANT_COLLECTION = os.environ.get('QDRANT_COLLECTION', 'notes')
 OLLAMA_HOST = os.environ.get('OLLAMA_HOST', 'ollama-server')
 OLLAMA_PORT = int(os.environ.get('OLLAMA_PORT', 11434))
 OLLAMA_MODEL = os.environ.get('OLLAMA_MODEL', 'llama3.2:1b')
+# Seconds to wait for Ollama before giving up, so a slow generation can't hold a worker thread indefinitely
+OLLAMA_TIMEOUT = float(os.environ.get('OLLAMA_TIMEOUT', 120))
+
+# Bi-encoder model for embedding notes and queries
+EMBEDDING_MODEL = os.environ.get('EMBEDDING_MODEL', 'all-MiniLM-L6-v2')
 
 # Cross-encoder model for re-ranking
 CROSS_ENCODER_MODEL = os.environ.get('CROSS_ENCODER_MODEL', 'cross-encoder/ms-marco-MiniLM-L-6-v2') 
\ No newline at end of file
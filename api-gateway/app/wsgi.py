@@ -4,4 +4,9 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
 
-application = get_wsgi_application() 
\ No newline at end of file
+application = get_wsgi_application()
+
+# Load the torch models together with the application so that, when gunicorn
+# preloads the app, workers inherit them from the master instead of each
+# loading a copy on their first request.
+from app import ml_models  # noqa: E402,F401
@@ -0,0 +1,80 @@
+# Production gunicorn configuration for the API gateway.
+#
+# The app is preloaded in the master process, so the sentence-transformer and
+# cross-encoder weights (see app/ml_models.py) are loaded once and shared
+# copy-on-write by every forked worker. Each worker then gets its share of the
+# cores for torch's intra-op thread pool so workers don't oversubscribe them.
+import gc
+import math
+import os
+
+# Part of the fork-sharing recipe from the gc module docs: no collections in
+# the master while the app loads (which would free objects and leave holes that
+# workers later fill, dirtying shared pages), freeze before forking, and
+# re-enable collection in each worker.
+gc.disable()
+
+
+def available_cpus():
+    """Cores this container may actually use: affinity mask capped by the cgroup quota."""
+    cpus = len(os.sched_getaffinity(0))
+
+    quota = None
+    try:
+        # cgroup v2, e.g. "200000 100000" or "max 100000"
+        with open('/sys/fs/cgroup/cpu.max') as f:
+            limit, period = f.read().split()
+        if limit != 'max':
+            quota = int(limit) / int(period)
+    except (OSError, ValueError):
+        try:
+            # cgroup v1, quota is -1 when unlimited
+            with open('/sys/fs/cgroup/cpu/cpu.cfs_quota_us') as f:
+                limit = int(f.read())
+            with open('/sys/fs/cgroup/cpu/cpu.cfs_period_us') as f:
+                period = int(f.read())
+            if limit > 0:
+                quota = limit / period
+        except (OSError, ValueError):
+            pass
+
+    if quota is not None:
+        cpus = min(cpus, max(1, math.ceil(quota)))
+    return cpus
+
+
+cpus = available_cpus()
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('WEB_CONCURRENCY', cpus))
+if workers < 1:
+    raise ValueError(f"WEB_CONCURRENCY must be at least 1, got {workers}")
+
+# Threads let a worker keep serving (including /health/) while other requests
+# wait on Ollama or Qdrant; model inference itself is serialised per worker.
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 300))
+preload_app = True
+
+torch_threads = int(os.environ.get('TORCH_NUM_THREADS', max(1, cpus // workers)))
+
+# GNU OpenMP is not fork-safe: if the master ever spins up a multi-threaded
+# pool (loading the weights does), children can hang in their first parallel
+# region. Keep the master single-threaded and size each worker after forking.
+os.environ['OMP_NUM_THREADS'] = '1'
+os.environ['MKL_NUM_THREADS'] = '1'
+
+
+def when_ready(server):
+    # Move everything allocated while loading the app into the permanent
+    # generation so the garbage collector in the workers doesn't write to
+    # (and thereby un-share) the pages holding it.
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    import torch
+
+    gc.enable()
+    torch.set_num_threads(torch_threads)
@@ -12,5 +12,5 @@ python manage.py sync_from_qdrant
 # Collect static files
 python manage.py collectstatic --noinput
 
-# Start Gunicorn
-gunicorn --timeout 300 --workers 1 --bind 0.0.0.0:8000 app.wsgi:application 
\ No newline at end of file
+# Start Gunicorn (workers, threads and preloading are set in gunicorn.conf.py)
+gunicorn --config gunicorn.conf.py app.wsgi:application 
\ No newline at end of file